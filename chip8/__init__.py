@@ -0,0 +1,4 @@
+from .core import Chip8Core
+from .pacing import FramePacer, raise_timer_resolution
+
+__all__ = ["Chip8Core", "FramePacer", "raise_timer_resolution"]
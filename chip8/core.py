@@ -0,0 +1,589 @@
+import random
+import struct
+import sys
+from array import array
+
+DEFAULT_SPEED = 700  # Instructions per second
+ROW_MASK = (1 << 64) - 1  # A display row packed into one 64-bit int
+
+_unpack_H = struct.Struct('>H').unpack_from  # Big-endian opcode fetch straight from memory
+
+# Built-in 4x5 hex digit sprites, loaded at 0x000
+FONTSET = bytes([
+    0xF0, 0x90, 0x90, 0x90, 0xF0,  # 0
+    0x20, 0x60, 0x20, 0x20, 0x70,  # 1
+    0xF0, 0x10, 0xF0, 0x80, 0xF0,  # 2
+    0xF0, 0x10, 0xF0, 0x10, 0xF0,  # 3
+    0x90, 0x90, 0xF0, 0x10, 0x10,  # 4
+    0xF0, 0x80, 0xF0, 0x10, 0xF0,  # 5
+    0xF0, 0x80, 0xF0, 0x90, 0xF0,  # 6
+    0xF0, 0x10, 0x20, 0x40, 0x40,  # 7
+    0xF0, 0x90, 0xF0, 0x90, 0xF0,  # 8
+    0xF0, 0x90, 0xF0, 0x10, 0xF0,  # 9
+    0xF0, 0x90, 0xF0, 0x90, 0x90,  # A
+    0xE0, 0x90, 0xE0, 0x90, 0xE0,  # B
+    0xF0, 0x80, 0x80, 0x80, 0xF0,  # C
+    0xE0, 0x90, 0x90, 0x90, 0xE0,  # D
+    0xF0, 0x80, 0xF0, 0x80, 0xF0,  # E
+    0xF0, 0x80, 0xF0, 0x80, 0x80,  # F
+])
+
+
+def _place_sprite_byte(byte, x):
+    # Put byte's bits at columns x..x+7 of a row, wrapping past the right edge
+    sprite = byte << 56
+    return ((sprite >> x) | (sprite << (64 - x))) & ROW_MASK
+
+
+# SPRITE_ROWS[x][byte] is a sprite byte already placed at column x
+SPRITE_ROWS = [tuple(_place_sprite_byte(byte, x) for byte in range(256)) for x in range(64)]
+
+
+def _nop():
+    pass
+
+
+class Chip8Core:
+    """CHIP-8 machine state and interpreter.
+
+    Where CHIP-8 implementations disagree, this core follows the common modern
+    (CHIP-48 era) behaviour:
+
+    - 8xy6 and 8xyE shift Vx in place and ignore Vy.
+    - Fx55 and Fx65 leave I unchanged.
+    - Bnnn jumps to nnn + V0.
+    - Sprites drawn past the right or bottom edge wrap around instead of clipping.
+    - The 8xy* ALU ops write VF after the result, so the flag wins when x is F.
+    """
+
+    __slots__ = (
+        'memory', 'V', 'I', 'pc', 'stack', 'sp', 'delay_timer', 'sound_timer',
+        'rows', 'vblank_dirty', 'keys', 'waiting_for_key', 'waiting_key_register',
+        '_speed', '_timer_divider', '_code16', '_decode_cache',
+        '_ops', '_ops_0', '_ops_8', '_ops_E', '_ops_F',
+    )
+
+    def __init__(self, speed=DEFAULT_SPEED):
+        # 4KB memory
+        self.memory = bytearray(4096)
+
+        # 16 general purpose 8-bit registers: V0 to VF
+        self.V = bytearray(16)
+
+        # 16-bit register (generally used to store memory addresses)
+        self.I = 0
+
+        # Program counter starts at 0x200 where most Chip-8 ROMs begin
+        self.pc = 0x200
+
+        # Fixed 16-level stack for subroutine calls, sp indexes the next free slot
+        self.stack = array('H', [0] * 16)
+        self.sp = 0
+
+        # Timers (decrement at 60Hz when > 0)
+        self.delay_timer = 0
+        self.sound_timer = 0
+
+        # 64x32 monochrome display, one 64-bit int per row (bit 63 = x 0)
+        self.rows = [0] * 32
+
+        # Set by the 00E0 clear and Dxyn draw handlers; the UI redraws and clears it
+        self.vblank_dirty = False
+
+        # Keys (0-F)
+        self.keys = bytearray(16)
+
+        # Fx0A halts execution until a key press lands in V[waiting_key_register]
+        self.waiting_for_key = False
+        self.waiting_key_register = 0
+
+        # Instructions per second; the 60Hz timers are divided down from it
+        self._timer_divider = 0
+        self.speed = speed
+
+        # Decoded opcodes: opcode -> zero-argument handler with operands baked in
+        self._decode_cache = {}
+
+        # Opcode dispatch: builders indexed by the top nibble, with sub-tables
+        # for the 0x0 (by NNN), 0x8 (by N), 0xE and 0xF (by NN) families
+        nop = self._op_nop
+        self._ops = [
+            self._op_0, self._op_jump, self._op_call, self._op_skip_eq,
+            self._op_skip_ne, self._op_skip_eq_reg, self._op_set_vx, self._op_add_vx,
+            self._op_8, self._op_skip_ne_reg, self._op_set_i, self._op_jump_v0,
+            self._op_rand, self._op_draw, self._op_E, self._op_F,
+        ]
+        self._ops_0 = {
+            0x0E0: self._op_cls,  # Clear the display
+            0x0EE: self._op_ret,  # Return from subroutine
+        }
+        self._ops_8 = [
+            self._op_8xy0, self._op_8xy1, self._op_8xy2, self._op_8xy3,
+            self._op_8xy4, self._op_8xy5, self._op_8xy6, self._op_8xy7,
+            nop, nop, nop, nop,
+            nop, nop, self._op_8xyE, nop,
+        ]
+        self._ops_E = {
+            0x9E: self._op_skip_key,
+            0xA1: self._op_skip_not_key,
+        }
+        self._ops_F = {
+            0x07: self._op_get_delay,
+            0x0A: self._op_wait_key,
+            0x15: self._op_set_delay,
+            0x18: self._op_set_sound,
+            0x1E: self._op_add_i,
+            0x29: self._op_font,
+            0x33: self._op_bcd,
+            0x55: self._op_store_regs,
+            0x65: self._op_load_regs,
+        }
+
+        # Load Chip-8 "fontset" into memory
+        self._load_fonts()
+
+    def _load_fonts(self):
+        self.memory[0:len(FONTSET)] = FONTSET
+        self._refresh_code16()
+
+    @property
+    def speed(self):
+        """Instructions per second, used to divide the timers down to 60Hz."""
+        return self._speed
+
+    @speed.setter
+    def speed(self, value):
+        self._speed = value
+        # A divider left over from a faster speed would tick the timers every cycle
+        self._timer_divider %= value
+
+    def load_rom(self, rom_data):
+        """Copy ROM bytes into memory at 0x200."""
+        if len(rom_data) > len(self.memory) - 0x200:
+            raise ValueError(f"ROM is too large ({len(rom_data)} bytes)")
+        self.memory[0x200:0x200 + len(rom_data)] = rom_data
+        self._refresh_code16()
+
+    def _refresh_code16(self):
+        # Big-endian 16-bit word view of memory so an even-pc fetch is a single index
+        self._code16 = array('H')
+        self._code16.frombytes(self.memory)
+        if sys.byteorder == 'little':
+            self._code16.byteswap()
+
+    def write_memory(self, address, data):
+        """Write data to memory at address, keeping the word shadow in step."""
+        end = address + len(data)
+        if end > len(self.memory):
+            raise IndexError(f"Memory write out of range at {address:#05x}")
+        self.memory[address:end] = data
+        first = address & ~1
+        last = (end + 1) & ~1
+        words = array('H')
+        words.frombytes(self.memory[first:last])
+        if sys.byteorder == 'little':
+            words.byteswap()
+        self._code16[first >> 1:last >> 1] = words
+
+    def press_key(self, key):
+        """Mark key (0-F) as held, completing a pending Fx0A wait."""
+        self.keys[key] = 1
+        if self.waiting_for_key:
+            self.V[self.waiting_key_register] = key
+            self.waiting_for_key = False
+
+    def release_key(self, key):
+        self.keys[key] = 0
+
+    def cycle(self):
+        """Fetch, decode and execute one instruction, then step the timers."""
+        self.run_batch(1)
+
+    def run_batch(self, n):
+        """Execute n cycles back to back with the per-cycle lookups bound to locals.
+
+        pc stays on self rather than in a local: the handler closures read and
+        write self.pc for jumps, calls and skips.
+        """
+        code16 = self._code16
+        cache = self._decode_cache
+        decode = self._decode
+        update_timers = self._update_timers
+        fetch_unaligned = self._fetch_unaligned
+        for _ in range(n):
+            if not self.waiting_for_key:
+                pc = self.pc
+                # An even pc past the end of memory raises IndexError from code16
+                opcode = fetch_unaligned(pc) if pc & 1 else code16[pc >> 1]
+                self.pc = pc + 2
+                (cache.get(opcode) or decode(opcode))()
+            update_timers()
+
+    def _fetch_unaligned(self, pc):
+        # Odd pc: the word straddles two shadow entries, so read the bytes directly
+        if pc > len(self.memory) - 2:
+            raise IndexError(f"Program counter out of range at {pc:#05x}")
+        return _unpack_H(self.memory, pc)[0]
+
+    def _update_timers(self):
+        """Update timers at 60Hz by counting cycles rather than reading the clock."""
+        # Accumulate 60 per cycle and tick once per speed, so the rate stays
+        # exactly 60Hz even when speed isn't a multiple of 60
+        self._timer_divider += 60
+        if self._timer_divider >= self._speed:
+            self._timer_divider -= self._speed
+            if self.delay_timer > 0:
+                self.delay_timer -= 1
+            if self.sound_timer > 0:
+                self.sound_timer -= 1
+                # Implement sound here if desired (e.g., beep)
+
+    def _decode(self, opcode):
+        # Specialise once per distinct opcode word; later fetches hit the cache
+        handler = self._ops[opcode >> 12](opcode)
+        self._decode_cache[opcode] = handler
+        return handler
+
+    # Each _op_* builder takes the opcode word and returns a zero-argument
+    # handler with its operands already extracted into closure constants.
+
+    def _op_nop(self, opcode):
+        return _nop
+
+    def _op_0(self, opcode):
+        return self._ops_0.get(opcode & 0x0FFF, self._op_nop)(opcode)
+
+    def _op_8(self, opcode):
+        return self._ops_8[opcode & 0x000F](opcode)
+
+    def _op_E(self, opcode):
+        return self._ops_E.get(opcode & 0x00FF, self._op_nop)(opcode)
+
+    def _op_F(self, opcode):
+        return self._ops_F.get(opcode & 0x00FF, self._op_nop)(opcode)
+
+    def _op_cls(self, opcode):
+        def clear_display():
+            self.rows = [0] * 32
+            self.vblank_dirty = True
+        return clear_display
+
+    def _op_ret(self, opcode):
+        stack = self.stack
+
+        def ret():
+            if self.sp == 0:
+                raise IndexError("Stack underflow on return")
+            self.sp -= 1
+            self.pc = stack[self.sp]
+        return ret
+
+    def _op_jump(self, opcode):
+        nnn = opcode & 0x0FFF
+
+        def jump():
+            self.pc = nnn
+        return jump
+
+    def _op_call(self, opcode):
+        nnn = opcode & 0x0FFF
+        stack = self.stack
+
+        def call():
+            if self.sp == len(stack):
+                raise IndexError("Stack overflow on call")
+            stack[self.sp] = self.pc
+            self.sp += 1
+            self.pc = nnn
+        return call
+
+    def _op_skip_eq(self, opcode):
+        V = self.V
+        x = (opcode & 0x0F00) >> 8
+        nn = opcode & 0x00FF
+
+        def skip_eq():
+            if V[x] == nn:
+                self.pc += 2
+        return skip_eq
+
+    def _op_skip_ne(self, opcode):
+        V = self.V
+        x = (opcode & 0x0F00) >> 8
+        nn = opcode & 0x00FF
+
+        def skip_ne():
+            if V[x] != nn:
+                self.pc += 2
+        return skip_ne
+
+    def _op_skip_eq_reg(self, opcode):
+        V = self.V
+        x = (opcode & 0x0F00) >> 8
+        y = (opcode & 0x00F0) >> 4
+
+        def skip_eq_reg():
+            if V[x] == V[y]:
+                self.pc += 2
+        return skip_eq_reg
+
+    def _op_skip_ne_reg(self, opcode):
+        V = self.V
+        x = (opcode & 0x0F00) >> 8
+        y = (opcode & 0x00F0) >> 4
+
+        def skip_ne_reg():
+            if V[x] != V[y]:
+                self.pc += 2
+        return skip_ne_reg
+
+    def _op_set_vx(self, opcode):
+        V = self.V
+        x = (opcode & 0x0F00) >> 8
+        nn = opcode & 0x00FF
+
+        def set_vx():
+            V[x] = nn
+        return set_vx
+
+    def _op_add_vx(self, opcode):
+        V = self.V
+        x = (opcode & 0x0F00) >> 8
+        nn = opcode & 0x00FF
+
+        def add_vx():
+            V[x] = (V[x] + nn) & 0xFF
+        return add_vx
+
+    def _op_8xy0(self, opcode):
+        V = self.V
+        x = (opcode & 0x0F00) >> 8
+        y = (opcode & 0x00F0) >> 4
+
+        def load():
+            V[x] = V[y]
+        return load
+
+    def _op_8xy1(self, opcode):
+        V = self.V
+        x = (opcode & 0x0F00) >> 8
+        y = (opcode & 0x00F0) >> 4
+
+        def bit_or():
+            V[x] |= V[y]
+        return bit_or
+
+    def _op_8xy2(self, opcode):
+        V = self.V
+        x = (opcode & 0x0F00) >> 8
+        y = (opcode & 0x00F0) >> 4
+
+        def bit_and():
+            V[x] &= V[y]
+        return bit_and
+
+    def _op_8xy3(self, opcode):
+        V = self.V
+        x = (opcode & 0x0F00) >> 8
+        y = (opcode & 0x00F0) >> 4
+
+        def bit_xor():
+            V[x] ^= V[y]
+        return bit_xor
+
+    def _op_8xy4(self, opcode):
+        V = self.V
+        x = (opcode & 0x0F00) >> 8
+        y = (opcode & 0x00F0) >> 4
+
+        def add():
+            total = V[x] + V[y]
+            V[x] = total & 0xFF
+            V[0xF] = total >> 8  # Carry
+        return add
+
+    def _op_8xy5(self, opcode):
+        V = self.V
+        x = (opcode & 0x0F00) >> 8
+        y = (opcode & 0x00F0) >> 4
+
+        def sub():
+            not_borrow = int(V[x] >= V[y])
+            V[x] = (V[x] - V[y]) & 0xFF
+            V[0xF] = not_borrow
+        return sub
+
+    def _op_8xy6(self, opcode):
+        V = self.V
+        x = (opcode & 0x0F00) >> 8
+
+        def shift_right():
+            low_bit = V[x] & 0x1
+            V[x] >>= 1
+            V[0xF] = low_bit
+        return shift_right
+
+    def _op_8xy7(self, opcode):
+        V = self.V
+        x = (opcode & 0x0F00) >> 8
+        y = (opcode & 0x00F0) >> 4
+
+        def sub_reverse():
+            not_borrow = int(V[y] >= V[x])
+            V[x] = (V[y] - V[x]) & 0xFF
+            V[0xF] = not_borrow
+        return sub_reverse
+
+    def _op_8xyE(self, opcode):
+        V = self.V
+        x = (opcode & 0x0F00) >> 8
+
+        def shift_left():
+            high_bit = V[x] >> 7
+            V[x] = (V[x] << 1) & 0xFF
+            V[0xF] = high_bit
+        return shift_left
+
+    def _op_set_i(self, opcode):
+        nnn = opcode & 0x0FFF
+
+        def set_i():
+            self.I = nnn
+        return set_i
+
+    def _op_jump_v0(self, opcode):
+        V = self.V
+        nnn = opcode & 0x0FFF
+
+        def jump_v0():
+            self.pc = nnn + V[0]
+        return jump_v0
+
+    def _op_rand(self, opcode):
+        V = self.V
+        x = (opcode & 0x0F00) >> 8
+        nn = opcode & 0x00FF
+
+        def rand():
+            V[x] = random.randint(0, 255) & nn
+        return rand
+
+    def _op_draw(self, opcode):
+        V = self.V
+        memory = self.memory
+        vx = (opcode & 0x0F00) >> 8
+        vy = (opcode & 0x00F0) >> 4
+        height = opcode & 0x000F
+
+        def draw():
+            placed = SPRITE_ROWS[V[vx] % 64]
+            y = V[vy]
+            index = self.I
+            rows = self.rows
+            collision = 0
+            for row in range(height):
+                shifted = placed[memory[index + row]]
+                pixel_y = (y + row) % 32
+                old = rows[pixel_y]
+                if old & shifted:
+                    collision = 1  # Collision detected
+                rows[pixel_y] = old ^ shifted
+            V[0xF] = collision
+            self.vblank_dirty = True
+        return draw
+
+    def _op_skip_key(self, opcode):
+        V = self.V
+        keys = self.keys
+        x = (opcode & 0x0F00) >> 8
+
+        def skip_key():
+            if keys[V[x] & 0xF]:
+                self.pc += 2
+        return skip_key
+
+    def _op_skip_not_key(self, opcode):
+        V = self.V
+        keys = self.keys
+        x = (opcode & 0x0F00) >> 8
+
+        def skip_not_key():
+            if not keys[V[x] & 0xF]:
+                self.pc += 2
+        return skip_not_key
+
+    def _op_get_delay(self, opcode):
+        V = self.V
+        x = (opcode & 0x0F00) >> 8
+
+        def get_delay():
+            V[x] = self.delay_timer
+        return get_delay
+
+    def _op_wait_key(self, opcode):
+        x = (opcode & 0x0F00) >> 8
+
+        def wait_key():
+            self.waiting_for_key = True
+            self.waiting_key_register = x
+        return wait_key
+
+    def _op_set_delay(self, opcode):
+        V = self.V
+        x = (opcode & 0x0F00) >> 8
+
+        def set_delay():
+            self.delay_timer = V[x]
+        return set_delay
+
+    def _op_set_sound(self, opcode):
+        V = self.V
+        x = (opcode & 0x0F00) >> 8
+
+        def set_sound():
+            self.sound_timer = V[x]
+        return set_sound
+
+    def _op_add_i(self, opcode):
+        V = self.V
+        x = (opcode & 0x0F00) >> 8
+
+        def add_i():
+            self.I = (self.I + V[x]) & 0xFFFF
+        return add_i
+
+    def _op_font(self, opcode):
+        V = self.V
+        x = (opcode & 0x0F00) >> 8
+
+        def font():
+            self.I = (V[x] & 0xF) * 5
+        return font
+
+    def _op_bcd(self, opcode):
+        V = self.V
+        x = (opcode & 0x0F00) >> 8
+
+        def bcd():
+            value = V[x]
+            self.write_memory(self.I, (value // 100, value // 10 % 10, value % 10))
+        return bcd
+
+    def _op_store_regs(self, opcode):
+        V = self.V
+        x = (opcode & 0x0F00) >> 8
+
+        def store_regs():
+            self.write_memory(self.I, V[:x + 1])
+        return store_regs
+
+    def _op_load_regs(self, opcode):
+        V = self.V
+        memory = self.memory
+        x = (opcode & 0x0F00) >> 8
+
+        def load_regs():
+            if self.I + x + 1 > len(memory):
+                raise IndexError(f"Memory read out of range at {self.I:#05x}")
+            V[:x + 1] = memory[self.I:self.I + x + 1]
+        return load_regs
@@ -0,0 +1,49 @@
+import sys
+import time
+
+FRAME_NS = 1_000_000_000 // 60  # 60 Hz frame period in nanoseconds
+
+
+def raise_timer_resolution():
+    """On Windows, raise the system timer resolution from ~15.6 ms to 1 ms."""
+    if sys.platform == "win32":
+        import ctypes
+        ctypes.windll.winmm.timeBeginPeriod(1)
+
+
+class FramePacer:
+    """Paces a Tk after() loop at 60 Hz against absolute perf_counter_ns deadlines.
+
+    cycles_owed() turns the wall time elapsed since the previous call into whole
+    instructions at a given speed, carrying the fraction forward, so the
+    instruction rate doesn't depend on how precisely after() fires.
+    """
+
+    def __init__(self):
+        now = time.perf_counter_ns()
+        self._last_ns = now
+        self._next_frame_ns = now + FRAME_NS
+        self._cycle_budget = 0.0
+
+    def cycles_owed(self, speed):
+        """Return the instructions due since the last call, capped at 1/10 s worth."""
+        now = time.perf_counter_ns()
+        self._cycle_budget += (now - self._last_ns) * speed / 1e9
+        self._last_ns = now
+        cycles = int(self._cycle_budget)
+        self._cycle_budget -= cycles
+        # Cap catch-up so a stalled window doesn't burst
+        return min(cycles, speed // 10)
+
+    def idle(self):
+        """Discard time elapsed while paused so resuming doesn't owe cycles."""
+        self._last_ns = time.perf_counter_ns()
+        self._cycle_budget = 0.0
+
+    def next_delay_ms(self):
+        """Advance to the next frame deadline and return the after() delay to reach it."""
+        self._next_frame_ns += FRAME_NS
+        now = time.perf_counter_ns()
+        if self._next_frame_ns < now:
+            self._next_frame_ns = now + FRAME_NS  # Fell behind; don't try to catch up
+        return max(1, (self._next_frame_ns - now) // 1_000_000)
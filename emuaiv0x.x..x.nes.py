@@ -1,66 +1,16 @@
 import tkinter as tk
 from tkinter import filedialog, messagebox
-import time
 import os
-import threading
 
-# Ensure the Chip8Core class is defined here or imported if defined elsewhere
-import random
+from chip8.core import Chip8Core
+from chip8.pacing import FramePacer, raise_timer_resolution
 
-class Chip8Core:
-    def __init__(self):
-        # 4KB memory
-        self.memory = [0] * 4096
-        
-        # 16 general purpose 8-bit registers: V0 to VF
-        self.V = [0] * 16
-        
-        # 16-bit register (generally used to store memory addresses)
-        self.I = 0
-        
-        # Program counter starts at 0x200 where most Chip-8 ROMs begin
-        self.pc = 0x200
-        
-        # Stack for subroutine calls
-        self.stack = []
-        
-        # Timers (decrement at 60Hz when > 0)
-        self.delay_timer = 0
-        self.sound_timer = 0
-        
-        # 64×32 monochrome display (0 or 1 for each pixel)
-        self.display = [[0] * 64 for _ in range(32)]
-        
-        # Keys (0-F)
-        self.keys = [0] * 16
-        
-        # For certain opcodes, need to wait for key press
-        self.waiting_for_key = False
-        self.waiting_key_register = 0
-        
-        # Last timer update time
-        self.last_timer_update = time.time()
-
-        # Load Chip-8 "fontset" into memory
-        self._load_fonts()
-
-    # [Previous methods remain the same until _update_timers]
-
-    def _update_timers(self):
-        """Update timers at 60Hz independently of CPU speed."""
-        current_time = time.time()
-        elapsed = current_time - self.last_timer_update
-        
-        # Update timers at 60Hz
-        if elapsed >= 1/60:
-            if self.delay_timer > 0:
-                self.delay_timer -= 1
-            if self.sound_timer > 0:
-                self.sound_timer -= 1
-                # Implement sound here if desired (e.g., beep)
-            self.last_timer_update = current_time
+PIXEL_COLOURS = ("#000000", "#ffffff")  # PhotoImage colour for an off / on pixel
 
-    # [Rest of Chip8Core methods remain the same]
+# BYTE_COLOURS[byte] is the space-separated colours of 8 pixels packed MSB-first
+BYTE_COLOURS = tuple(
+    " ".join(PIXEL_COLOURS[(byte >> (7 - bit)) & 1] for bit in range(8)) for byte in range(256)
+)
 
 class Chip8EmulatorUI:
     """
@@ -73,16 +23,17 @@ class Chip8EmulatorUI:
         core (Chip8Core): The core emulation logic for CHIP-8.
         emulation_running (bool): Flag indicating if the emulation is currently running.
         emulation_speed (int): The speed of the emulation in instructions per second.
-        last_cycle_time (float): The time of the last emulation cycle.
-        emulation_thread (threading.Thread): The thread running the emulation loop.
+        pacer (FramePacer): Schedules ticks at 60 Hz and accrues the instructions owed.
         speed_var (tk.StringVar): The variable holding the emulation speed for the UI.
         canvas (tk.Canvas): The canvas widget for displaying the CHIP-8 screen.
-        rects (list): A 2D list of rectangle objects representing the CHIP-8 display pixels.
+        frame (tk.PhotoImage): A 64x32 image holding one pixel per CHIP-8 pixel.
+        image (tk.PhotoImage): The frame zoomed by scale, shown on the canvas.
     Methods:
         __init__(root): Initializes the Chip8EmulatorUI with the given root window.
         _setup_control_panel(): Sets up the control panel with buttons and speed control.
         _setup_display(): Sets up the display canvas with improved scaling.
-        _emulation_loop(): The main emulation loop with improved timing.
+        _update_display(): Blits the display into the frame image.
+        _tick(): Runs the cycles owed since the last tick and redraws if the display changed, rescheduling itself at 60 Hz.
     """
     def __init__(self, root):
         self.root = root
@@ -110,12 +61,13 @@ class Chip8EmulatorUI:
 
         # Emulation control
         self.emulation_running = False
-        self.emulation_speed = 700  # Increased to ~700 instructions per second
-        self.last_cycle_time = time.time()
+        self.emulation_speed = self.core.speed  # ~700 instructions per second
+
+        # Monotonic pacing: cycles owed accrue from elapsed perf_counter_ns time
+        self.pacer = FramePacer()
 
-        # Start the emulation loop in a separate thread
-        self.emulation_thread = threading.Thread(target=self._emulation_loop, daemon=True)
-        self.emulation_thread.start()
+        # Drive emulation from the Tk event loop, one batch per ~60 Hz frame
+        self.root.after(16, self._tick)
 
     def _setup_control_panel(self):
         """Set up the control panel with buttons and speed control."""
@@ -134,7 +86,7 @@ class Chip8EmulatorUI:
             try:
                 new_speed = int(self.speed_var.get())
                 if 100 <= new_speed <= 2000:
-                    self.emulation_speed = new_speed
+                    self.emulation_speed = self.core.speed = new_speed
             except ValueError:
                 pass
         
@@ -161,47 +113,42 @@ class Chip8EmulatorUI:
         )
         self.canvas.pack(pady=10)
 
-        # Initialize a 64x32 grid of rectangles
-        self.rects = []
-        for y in range(32):
-            row = []
-            for x in range(64):
-                rect = self.canvas.create_rectangle(
-                    x * self.scale, 
-                    y * self.scale,
-                    (x + 1) * self.scale, 
-                    (y + 1) * self.scale,
-                    fill="black", 
-                    outline="dark gray"  # Subtle grid
+        # Render into a 64x32 frame image, zoomed onto a scaled image shown on the canvas
+        self.frame = tk.PhotoImage(width=64, height=32)
+        self.image = tk.PhotoImage(width=64 * self.scale, height=32 * self.scale)
+        self.image_id = self.canvas.create_image(0, 0, image=self.image, anchor="nw")
+
+    def _update_display(self):
+        """Blit the whole display into the frame image in one put, then zoom it."""
+        self.frame.put(" ".join(
+            "{" + " ".join(BYTE_COLOURS[(row >> shift) & 0xFF] for shift in range(56, -8, -8)) + "}"
+            for row in self.core.rows
+        ))
+        self.image.tk.call(self.image.name, "copy", self.frame.name, "-zoom", self.scale, self.scale)
+
+    def _tick(self):
+        """Run the instructions owed since the last tick, then redraw once."""
+        if self.emulation_running:
+            try:
+                self.core.run_batch(self.pacer.cycles_owed(self.emulation_speed))
+                if self.core.vblank_dirty:
+                    self.core.vblank_dirty = False
+                    self._update_display()
+            except Exception as e:
+                self.emulation_running = False
+                messagebox.showerror(
+                    "Emulation Error", 
+                    f"An error occurred:\n{e}"
                 )
-                row.append(rect)
-            self.rects.append(row)
-
-    def _emulation_loop(self):
-        """Main emulation loop with improved timing."""
-        while True:
-            if self.emulation_running:
-                current_time = time.time()
-                elapsed = current_time - self.last_cycle_time
-                
-                if elapsed >= 1.0 / self.emulation_speed:
-                    try:
-                        self.core.cycle()
-                        self._update_display()
-                        self.last_cycle_time = current_time
-                    except Exception as e:
-                        self.emulation_running = False
-                        self.root.after(0, lambda: messagebox.showerror(
-                            "Emulation Error", 
-                            f"An error occurred:\n{e}"
-                        ))
-            
-            # Short sleep to prevent excessive CPU usage
-            time.sleep(0.001)
+        else:
+            self.pacer.idle()
+
+        self.root.after(self.pacer.next_delay_ms(), self._tick)
 
     # [Rest of the UI class methods remain the same]
 
 def main():
+    raise_timer_resolution()
     root = tk.Tk()
     emulator = Chip8EmulatorUI(root)
     root.mainloop()
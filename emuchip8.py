@@ -1,6 +1,8 @@
 import tkinter as tk
-import time
-import random
+
+from chip8.core import Chip8Core
+from chip8.pacing import FramePacer, raise_timer_resolution
+
 
 class Chip8Emulator:
     def __init__(self):
@@ -10,16 +12,20 @@ class Chip8Emulator:
         self.canvas = tk.Canvas(self.window, width=640, height=320, bg="black")
         self.canvas.pack()
 
-        # CHIP-8 specs
-        self.memory = [0] * 4096  # 4 KB memory
-        self.registers = [0] * 16  # 16 general-purpose registers
-        self.index_register = 0
-        self.pc = 0x200  # Program counter starts at 0x200
-        self.stack = []
-        self.delay_timer = 0
-        self.sound_timer = 0
-        self.display = [[0] * 64 for _ in range(32)]  # 64x32 display
-        self.keys = [0] * 16  # Input keys
+        # Persistent 64x32 grid of pixel rectangles, recoloured as pixels flip
+        self.rects = [
+            [
+                self.canvas.create_rectangle(
+                    x * 10, y * 10, x * 10 + 10, y * 10 + 10, fill="black", outline="black"
+                )
+                for x in range(64)
+            ]
+            for y in range(32)
+        ]
+        self.drawn_rows = [0] * 32  # Row bits last pushed to the canvas
+
+        # CHIP-8 machine state and interpreter
+        self.core = Chip8Core()
         self.running = True
 
         # Key mapping
@@ -29,84 +35,70 @@ class Chip8Emulator:
             'a': 0x7, 's': 0x8, 'd': 0x9, 'f': 0xE,
             'z': 0xA, 'x': 0x0, 'c': 0xB, 'v': 0xF
         }
+        # ASCII code -> CHIP-8 key, 0xFF for unmapped characters
+        self.key_lut = bytearray([0xFF] * 128)
+        for char, key in self.key_map.items():
+            self.key_lut[ord(char)] = key
         self.setup_input()
 
     def setup_input(self):
         self.window.bind("<KeyPress>", self.key_press)
         self.window.bind("<KeyRelease>", self.key_release)
 
+    def _lookup_key(self, char):
+        if len(char) == 1 and ord(char) < 128:
+            return self.key_lut[ord(char)]
+        return 0xFF
+
     def key_press(self, event):
-        if event.char in self.key_map:
-            self.keys[self.key_map[event.char]] = 1
+        key = self._lookup_key(event.char)
+        if key != 0xFF:
+            self.core.press_key(key)
 
     def key_release(self, event):
-        if event.char in self.key_map:
-            self.keys[self.key_map[event.char]] = 0
+        key = self._lookup_key(event.char)
+        if key != 0xFF:
+            self.core.release_key(key)
 
     def load_rom(self, file_path):
         with open(file_path, 'rb') as file:
             rom_data = file.read()
-        for i, byte in enumerate(rom_data):
-            self.memory[0x200 + i] = byte
-
-    def emulate_cycle(self):
-        opcode = self.memory[self.pc] << 8 | self.memory[self.pc + 1]  # Fetch opcode
-        self.pc += 2
-        self.execute_opcode(opcode)
-        self.update_timers()
-
-    def execute_opcode(self, opcode):
-        # Example: Decode and execute opcodes
-        if opcode == 0x00E0:  # Clear the display
-            self.display = [[0] * 64 for _ in range(32)]
-        elif opcode == 0x00EE:  # Return from subroutine
-            self.pc = self.stack.pop()
-        elif opcode & 0xF000 == 0x1000:  # Jump to address
-            self.pc = opcode & 0x0FFF
-        elif opcode & 0xF000 == 0x6000:  # Set register VX
-            x = (opcode & 0x0F00) >> 8
-            self.registers[x] = opcode & 0x00FF
-        elif opcode & 0xF000 == 0xA000:  # Set index register
-            self.index_register = opcode & 0x0FFF
-        elif opcode & 0xF000 == 0xD000:  # Draw sprite
-            x = self.registers[(opcode & 0x0F00) >> 8]
-            y = self.registers[(opcode & 0x00F0) >> 4]
-            height = opcode & 0x000F
-            self.registers[0xF] = 0
-            for row in range(height):
-                sprite_byte = self.memory[self.index_register + row]
-                for col in range(8):
-                    if sprite_byte & (0x80 >> col):
-                        pixel_x = (x + col) % 64
-                        pixel_y = (y + row) % 32
-                        if self.display[pixel_y][pixel_x] == 1:
-                            self.registers[0xF] = 1  # Collision detected
-                        self.display[pixel_y][pixel_x] ^= 1
-
-    def update_timers(self):
-        if self.delay_timer > 0:
-            self.delay_timer -= 1
-        if self.sound_timer > 0:
-            self.sound_timer -= 1
+        self.core.load_rom(rom_data)
 
     def render_graphics(self):
-        self.canvas.delete("all")
+        core = self.core
+        if not core.vblank_dirty:
+            return
+        core.vblank_dirty = False
         for y in range(32):
+            row = core.rows[y]
+            changed = row ^ self.drawn_rows[y]
+            if not changed:
+                continue
+            self.drawn_rows[y] = row
+            rects = self.rects[y]
             for x in range(64):
-                if self.display[y][x]:
-                    self.canvas.create_rectangle(
-                        x * 10, y * 10, x * 10 + 10, y * 10 + 10, fill="white"
-                    )
+                bit = 1 << (63 - x)
+                if changed & bit:
+                    self.canvas.itemconfig(rects[x], fill="white" if row & bit else "black")
 
     def run(self):
-        while self.running:
-            self.emulate_cycle()
-            self.render_graphics()
-            self.window.update()
-            time.sleep(1 / 60)  # 60 Hz refresh rate
+        self.pacer = FramePacer()
+        self.window.after(16, self._tick)
+        self.window.mainloop()
+
+    def _tick(self):
+        if not self.running:
+            return
+        # Run the instructions owed by wall time, not a fixed per-frame count,
+        # so after()'s millisecond rounding doesn't skew the instruction rate
+        self.core.run_batch(self.pacer.cycles_owed(self.core.speed))
+        self.render_graphics()
+        self.window.after(self.pacer.next_delay_ms(), self._tick)
 
 
 if __name__ == "__main__":
+    raise_timer_resolution()
     emulator = Chip8Emulator()
     emulator.load_rom("path_to_rom.ch8")  # Replace with the path to your CHIP-8 ROM
     emulator.run()
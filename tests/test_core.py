@@ -0,0 +1,271 @@
+import random
+
+import pytest
+
+from chip8.core import Chip8Core
+
+
+def load(core, *words, at=0x200):
+    """Write opcode words to memory starting at `at`."""
+    core.write_memory(at, b"".join(word.to_bytes(2, "big") for word in words))
+
+
+def run(*words, setup=None):
+    """Load words at 0x200 and execute exactly that many instructions."""
+    core = Chip8Core()
+    load(core, *words)
+    if setup:
+        setup(core)
+    core.run_batch(len(words))
+    return core
+
+
+def pixel(core, x, y):
+    return (core.rows[y] >> (63 - x)) & 1
+
+
+# 0x0 family / 1nnn / 2nnn
+
+def test_clear_display_sets_vblank_dirty():
+    core = Chip8Core()
+    core.rows[5] = 0xFF
+    load(core, 0x00E0)
+    core.cycle()
+    assert core.rows == [0] * 32
+    assert core.vblank_dirty
+
+
+def test_jump():
+    assert run(0x1345).pc == 0x345
+
+
+def test_call_and_return_through_sp():
+    core = Chip8Core()
+    load(core, 0x2300)
+    load(core, 0x00EE, at=0x300)
+    core.cycle()
+    assert core.pc == 0x300
+    assert core.sp == 1
+    assert core.stack[0] == 0x202
+    core.cycle()
+    assert core.pc == 0x202
+    assert core.sp == 0
+
+
+def test_return_on_empty_stack_raises_without_side_effects():
+    core = Chip8Core()
+    load(core, 0x00EE)
+    with pytest.raises(IndexError):
+        core.cycle()
+    assert core.sp == 0
+
+
+def test_call_past_sixteen_levels_raises():
+    core = Chip8Core()
+    load(core, 0x2200)  # Calls itself forever
+    core.run_batch(16)
+    assert core.sp == 16
+    with pytest.raises(IndexError):
+        core.cycle()
+    assert core.sp == 16
+
+
+def test_fetch_at_odd_pc_past_end_of_memory_raises():
+    core = Chip8Core()
+    core.pc = 0xFFF
+    with pytest.raises(IndexError):
+        core.cycle()
+
+
+def test_fetch_after_jump_past_end_of_memory_raises():
+    core = run(0x60FF, 0xBFFF)  # Jumps to 0x10FE
+    assert core.pc == 0x10FE
+    with pytest.raises(IndexError):
+        core.cycle()
+
+
+# 3xnn / 4xnn / 5xy0 / 9xy0 skips
+
+@pytest.mark.parametrize("words, skipped", [
+    ((0x6042, 0x3042), True),
+    ((0x6042, 0x3043), False),
+    ((0x6042, 0x4043), True),
+    ((0x6042, 0x4042), False),
+    ((0x6042, 0x6142, 0x5010), True),
+    ((0x6042, 0x6143, 0x5010), False),
+    ((0x6042, 0x6143, 0x9010), True),
+    ((0x6042, 0x6142, 0x9010), False),
+])
+def test_skips(words, skipped):
+    core = run(*words)
+    assert core.pc == 0x200 + 2 * len(words) + (2 if skipped else 0)
+
+
+# 6xnn / 7xnn
+
+def test_set_and_add_wraps_without_touching_vf():
+    core = run(0x60FF, 0x7002)
+    assert core.V[0] == 0x01
+    assert core.V[0xF] == 0
+
+
+# 8xy* ALU
+
+def test_logic_ops():
+    assert run(0x600C, 0x610A, 0x8011).V[0] == 0x0E
+    assert run(0x600C, 0x610A, 0x8012).V[0] == 0x08
+    assert run(0x600C, 0x610A, 0x8013).V[0] == 0x06
+    assert run(0x610A, 0x8010).V[0] == 0x0A
+
+
+def test_add_sets_carry_in_vf():
+    core = run(0x60FF, 0x6102, 0x8014)
+    assert core.V[0] == 0x01
+    assert core.V[0xF] == 1
+    core = run(0x6010, 0x6102, 0x8014)
+    assert core.V[0] == 0x12
+    assert core.V[0xF] == 0
+
+
+def test_sub_sets_not_borrow_in_vf():
+    core = run(0x6001, 0x6102, 0x8015)
+    assert core.V[0] == 0xFF
+    assert core.V[0xF] == 0
+    core = run(0x6005, 0x6102, 0x8015)
+    assert core.V[0] == 0x03
+    assert core.V[0xF] == 1
+    core = run(0x6005, 0x6102, 0x8017)
+    assert core.V[0] == 0xFD
+    assert core.V[0xF] == 0
+
+
+def test_shifts_use_vx_and_ignore_vy():
+    core = run(0x6003, 0x61F0, 0x8016)
+    assert core.V[0] == 0x01
+    assert core.V[0xF] == 1
+    core = run(0x6081, 0x6101, 0x801E)
+    assert core.V[0] == 0x02
+    assert core.V[0xF] == 1
+
+
+def test_flag_result_wins_when_x_is_f():
+    assert run(0x6FFF, 0x6102, 0x8F14).V[0xF] == 1
+
+
+# Annn / Bnnn / Cxnn
+
+def test_set_index_and_jump_plus_v0():
+    assert run(0xA123).I == 0x123
+    assert run(0x6004, 0xB300).pc == 0x304
+
+
+def test_random_is_masked():
+    random.seed(1234)
+    assert run(0xC00F).V[0] <= 0x0F
+
+
+# Dxyn
+
+def test_draw_sets_collision_and_erases_on_redraw():
+    # Digit 0 sprite from the fontset at (1, 1)
+    core = run(0x6001, 0xA000, 0xD005)
+    assert core.V[0xF] == 0
+    assert pixel(core, 1, 1) and pixel(core, 4, 1)
+    assert core.vblank_dirty
+    load(core, 0xD005, at=core.pc)
+    core.cycle()
+    assert core.V[0xF] == 1
+    assert core.rows == [0] * 32
+
+
+def test_draw_wraps_past_right_and_bottom_edges():
+    # 0xF0 top row of digit 0 at x=62, y=31
+    core = run(0x603E, 0x611F, 0xA000, 0xD011)
+    assert pixel(core, 62, 31) and pixel(core, 63, 31)
+    assert pixel(core, 0, 31) and pixel(core, 1, 31)
+    assert not pixel(core, 2, 31)
+
+
+# Ex9E / ExA1
+
+def test_key_skips():
+    def hold_key_five(core):
+        core.press_key(5)
+
+    assert run(0x6005, 0xE09E, setup=hold_key_five).pc == 0x206
+    assert run(0x6005, 0xE0A1, setup=hold_key_five).pc == 0x204
+    assert run(0x6005, 0xE0A1).pc == 0x206
+
+
+# Fx*
+
+def test_timers_load_read_and_tick_at_sixty_hz():
+    core = Chip8Core(speed=700)
+    load(core, 0x6078, 0xF015, 0xF018, 0xF107, 0x1208)
+    core.run_batch(4)
+    assert core.V[1] == 120
+    assert core.sound_timer == 120
+    core.run_batch(700 - 4)
+    assert core.delay_timer == 60
+    assert core.sound_timer == 60
+
+
+def test_lowering_speed_mid_run_keeps_timers_at_sixty_hz():
+    core = Chip8Core(speed=2000)
+    core.write_memory(0x200, b"\x12\x00")  # Spin in place
+    core.delay_timer = 255
+    core.run_batch(1999)  # Leaves the divider just short of a tick
+    ticked = 255 - core.delay_timer
+    core.speed = 100
+    core.run_batch(100)
+    assert 255 - core.delay_timer - ticked == 60
+
+
+def test_wait_key_blocks_until_press_key():
+    core = Chip8Core()
+    load(core, 0xF30A, 0x6001)
+    core.run_batch(10)
+    assert core.waiting_for_key
+    assert core.pc == 0x202
+    assert core.V[0] == 0
+    core.press_key(0xB)
+    assert not core.waiting_for_key
+    assert core.V[3] == 0xB
+    core.cycle()
+    assert core.V[0] == 1
+
+
+def test_add_index_and_font_address():
+    assert run(0xA100, 0x6005, 0xF01E).I == 0x105
+    assert run(0x600A, 0xF029).I == 0x0A * 5
+
+
+def test_bcd():
+    core = run(0xA300, 0x60FE, 0xF033)
+    assert list(core.memory[0x300:0x303]) == [2, 5, 4]
+
+
+def test_store_and_load_registers_leave_index_unchanged():
+    core = run(0xA300, 0x6011, 0x6122, 0x6233, 0xF255)
+    assert list(core.memory[0x300:0x304]) == [0x11, 0x22, 0x33, 0x00]
+    assert core.I == 0x300
+    core = run(0xA000, 0xF165)
+    assert list(core.V[:3]) == [0xF0, 0x90, 0x00]
+    assert core.I == 0x000
+
+
+def test_store_over_code_executes_the_new_instruction():
+    # Overwrite the 00E0 at 0x208 with 0x6077 (V0 = 0x77), then run it
+    core = Chip8Core()
+    load(core, 0xA208, 0x6060, 0x6177, 0xF155, 0x00E0)
+    core.run_batch(5)
+    assert core.V[0] == 0x77
+    assert not core.vblank_dirty
+
+
+def test_store_out_of_range_raises():
+    core = run(0xAFFF, 0x6000)
+    load(core, 0xF155, at=core.pc)
+    with pytest.raises(IndexError):
+        core.cycle()
+    assert len(core.memory) == 4096